@@ -0,0 +1,4 @@
+from flask_caching import Cache
+
+# In-process cache for read-mostly endpoints; entries are dropped by the write routes
+cache = Cache(config={'CACHE_TYPE': 'SimpleCache'})
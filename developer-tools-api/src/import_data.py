@@ -7,7 +7,7 @@ This script imports data from the CSV file and populates the database
 import os
 import sys
 import csv
-import json
+import re
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -17,6 +17,12 @@ os.environ['FLASK_ENV'] = 'development'
 
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, event, func, text
+from sqlalchemy.schema import DropTable
+
+from src.models import sqlite  # noqa: F401 - registers the SQLite PRAGMA listener
+from src.models.search_index import create_search_index
+from src.models.types import JSONList
 
 # Create Flask app and database
 app = Flask(__name__)
@@ -26,28 +32,64 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 db = SQLAlchemy(app)
 
+# Rows buffered per INSERT executemany during CSV import
+BATCH_SIZE = 5000
+
+# (model column, CSV column) pairs - note the CSV uses 'Categories' and spaces in names
+TEXT_COLUMNS = (
+    ('name', 'Name'),
+    ('category', 'Categories'),
+    ('description', 'Description'),
+    ('url', 'URL'),
+    ('pricing', 'Pricing'),
+)
+ARRAY_COLUMNS = (
+    ('frameworks', 'Frameworks'),
+    ('supported_languages', 'Supported_Languages'),  # This might not exist in CSV
+    ('features', 'Features'),
+    ('native_integrations', 'Native Integrations'),
+    ('verified_integrations', 'Verified Integrations'),
+    ('notable_strengths', 'Notable Strengths'),
+    ('known_limitations', 'Known Limitations'),
+)
+SCORE_COLUMNS = (
+    ('maturity_score', 'Maturity Score'),
+    ('popularity_score', 'Popularity Score'),
+)
+
+# Columns that add_enhanced_data() may overwrite
+ENHANCED_FIELDS = ('pricing', 'verified_integrations', 'notable_strengths', 'known_limitations')
+
+# Separator for comma-separated array cells, swallowing surrounding whitespace
+ARRAY_SPLIT_PATTERN = re.compile(r'\s*,\s*')
+
 # Define the model directly here to avoid import issues
 class DeveloperTool(db.Model):
     __tablename__ = 'developer_tools'
+    __table_args__ = (
+        db.Index('ix_cat_pop', 'category', 'popularity_score'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False, unique=True)
-    category = db.Column(db.String(100), nullable=False)
+    # Lower-cased name for index-backed prefix search; VIRTUAL so it can be added to existing tables
+    name_lc = db.Column(db.String(200), db.Computed('lower(name)', persisted=False), index=True)
+    category = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.Text, nullable=True)
     url = db.Column(db.String(500), nullable=True)
     
     # JSON fields for arrays
-    frameworks = db.Column(db.Text, nullable=True)
-    supported_languages = db.Column(db.Text, nullable=True)
-    features = db.Column(db.Text, nullable=True)
-    native_integrations = db.Column(db.Text, nullable=True)
-    verified_integrations = db.Column(db.Text, nullable=True)
-    notable_strengths = db.Column(db.Text, nullable=True)
-    known_limitations = db.Column(db.Text, nullable=True)
+    frameworks = db.Column(JSONList, nullable=True)
+    supported_languages = db.Column(JSONList, nullable=True)
+    features = db.Column(JSONList, nullable=True)
+    native_integrations = db.Column(JSONList, nullable=True)
+    verified_integrations = db.Column(JSONList, nullable=True)
+    notable_strengths = db.Column(JSONList, nullable=True)
+    known_limitations = db.Column(JSONList, nullable=True)
     
     # Scoring fields
-    maturity_score = db.Column(db.Integer, nullable=True)
-    popularity_score = db.Column(db.Integer, nullable=True)
+    maturity_score = db.Column(db.Integer, nullable=True, index=True)
+    popularity_score = db.Column(db.Integer, nullable=True, index=True)
     
     # Additional fields
     pricing = db.Column(db.Text, nullable=True)
@@ -56,14 +98,22 @@ class DeveloperTool(db.Model):
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
     updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(), onupdate=db.func.current_timestamp())
 
+@event.listens_for(DeveloperTool.__table__, 'after_create')
+def _create_search_index(target, connection, **kw):
+    """Rebuild the full-text index whenever the tools table is recreated"""
+    create_search_index(connection)
+
 def parse_array_field(field_value):
     """Parse array fields from CSV (comma-separated values)"""
-    if not field_value or field_value.strip() == "Not specified":
+    if not field_value:
+        return []
+    
+    field_value = field_value.strip()
+    if field_value == "Not specified":
         return []
     
-    # Split by comma and clean up
-    items = [item.strip() for item in field_value.split(',') if item.strip()]
-    return items
+    # Split on commas and their surrounding whitespace in one regex pass
+    return [item for item in ARRAY_SPLIT_PATTERN.split(field_value) if item]
 
 def parse_score_field(field_value):
     """Parse score fields, handling 'Not specified' values"""
@@ -76,6 +126,34 @@ def parse_score_field(field_value):
     except (ValueError, TypeError):
         return None
 
+def resolve_column_positions(header):
+    """Pair each model column with its index in the CSV header, or None if the CSV lacks it"""
+    index_of = {csv_column: index for index, csv_column in enumerate(header)}
+    return tuple(
+        tuple((column, index_of.get(csv_column)) for column, csv_column in columns)
+        for columns in (TEXT_COLUMNS, ARRAY_COLUMNS, SCORE_COLUMNS)
+    )
+
+def cell(row, index):
+    """Return the CSV cell at index, or '' if the CSV lacks the column or the row is short"""
+    if index is None or index >= len(row):
+        return ''
+    return row[index]
+
+def build_tool_row(row, positions):
+    """Map a positional CSV row onto developer_tools column values, or None if it has no name"""
+    text_positions, array_positions, score_positions = positions
+    
+    tool_row = {column: cell(row, index).strip() for column, index in text_positions}
+    if not tool_row['name']:
+        return None
+    
+    for column, index in array_positions:
+        tool_row[column] = parse_array_field(cell(row, index))
+    for column, index in score_positions:
+        tool_row[column] = parse_score_field(cell(row, index))
+    return tool_row
+
 def import_tools_from_csv(csv_file_path):
     """Import tools from CSV file"""
     
@@ -84,65 +162,60 @@ def import_tools_from_csv(csv_file_path):
         return False
     
     with app.app_context():
-        # Create tables
-        db.create_all()
-        
-        # Clear existing data (optional)
+        # Clear existing data by recreating the table rather than deleting row by row.
+        # DROP ... IF EXISTS and a direct CREATE avoid create_all()'s per-table
+        # existence checks; the CREATE also builds indexes and the search index
         print("Clearing existing tools...")
-        DeveloperTool.query.delete()
-        db.session.commit()
+        with db.engine.begin() as conn:
+            conn.execute(DropTable(DeveloperTool.__table__, if_exists=True))
+            DeveloperTool.__table__.create(conn)
         
         print(f"Importing tools from {csv_file_path}...")
         
-        with open(csv_file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
+        with open(csv_file_path, 'r', encoding='utf-8') as file, db.engine.begin() as conn:
+            # Positional rows avoid building a dict per row; columns are located once from the header
+            reader = csv.reader(file)
+            header = next(reader, [])
+            positions = resolve_column_positions(header)
+            name_index = dict(positions[0])['name']
+            insert_stmt = DeveloperTool.__table__.insert()
+            batch = []
             tools_imported = 0
             
             for row in reader:
+                # csv.reader yields [] for blank lines, which DictReader skipped
+                if not row:
+                    continue
+                
                 try:
-                    # Create new tool instance
-                    tool = DeveloperTool()
-                    
-                    # Basic fields
-                    tool.name = row.get('Name', '').strip()
-                    tool.category = row.get('Categories', '').strip()  # Note: CSV uses 'Categories'
-                    tool.description = row.get('Description', '').strip()
-                    tool.url = row.get('URL', '').strip()
-                    tool.pricing = row.get('Pricing', '').strip()
-                    
-                    # Skip if no name
-                    if not tool.name:
-                        continue
-                    
-                    # Array fields - using correct CSV column names
-                    tool.frameworks = json.dumps(parse_array_field(row.get('Frameworks', '')))
-                    tool.supported_languages = json.dumps(parse_array_field(row.get('Supported_Languages', '')))  # This might not exist in CSV
-                    tool.features = json.dumps(parse_array_field(row.get('Features', '')))
-                    tool.native_integrations = json.dumps(parse_array_field(row.get('Native Integrations', '')))  # Note: space in name
-                    tool.verified_integrations = json.dumps(parse_array_field(row.get('Verified Integrations', '')))  # Note: space in name
-                    tool.notable_strengths = json.dumps(parse_array_field(row.get('Notable Strengths', '')))  # Note: space in name
-                    tool.known_limitations = json.dumps(parse_array_field(row.get('Known Limitations', '')))  # Note: space in name
-                    
-                    # Score fields - using correct CSV column names
-                    tool.maturity_score = parse_score_field(row.get('Maturity Score', ''))  # Note: space in name
-                    tool.popularity_score = parse_score_field(row.get('Popularity Score', ''))  # Note: space in name
-                    
-                    # Add to database
-                    db.session.add(tool)
-                    tools_imported += 1
-                    
-                    if tools_imported % 10 == 0:
-                        print(f"Imported {tools_imported} tools...")
-                        
+                    tool_row = build_tool_row(row, positions)
                 except Exception as e:
-                    print(f"Error importing tool {row.get('Name', 'Unknown')}: {e}")
+                    name = cell(row, name_index) or 'Unknown'
+                    print(f"Error importing tool {name}: {e}")
                     continue
+                
+                # Skip if no name
+                if tool_row is None:
+                    continue
+                
+                batch.append(tool_row)
+                if len(batch) >= BATCH_SIZE:
+                    conn.execute(insert_stmt, batch)
+                    tools_imported += len(batch)
+                    print(f"Imported {tools_imported} tools...")
+                    batch.clear()
             
-            # Commit all changes
-            db.session.commit()
-            print(f"Successfully imported {tools_imported} tools!")
-            
-            return True
+            if batch:
+                conn.execute(insert_stmt, batch)
+                tools_imported += len(batch)
+        
+        # Refresh query planner statistics after the bulk load
+        db.session.execute(text("PRAGMA optimize"))
+        db.session.commit()
+        
+        print(f"Successfully imported {tools_imported} tools!")
+        
+        return True
 
 def add_enhanced_data():
     """Add the enhanced data we collected during our research"""
@@ -177,22 +250,30 @@ def add_enhanced_data():
         }
     }
     
+    # One row of bound values per tool; fields a tool doesn't enhance are passed
+    # as NULL and COALESCE keeps the existing column value
+    updates = []
+    for tool_name, enhancements in enhanced_data.items():
+        params = {'tool_name': tool_name}
+        for field in ENHANCED_FIELDS:
+            params[f'new_{field}'] = enhancements.get(field)
+        updates.append(params)
+    
+    tools = DeveloperTool.__table__
+    stmt = (
+        tools.update()
+        .where(tools.c.name == bindparam('tool_name'))
+        .values({
+            field: func.coalesce(bindparam(f'new_{field}', type_=tools.c[field].type), tools.c[field])
+            for field in ENHANCED_FIELDS
+        })
+    )
+    
     with app.app_context():
-        for tool_name, enhancements in enhanced_data.items():
-            tool = DeveloperTool.query.filter_by(name=tool_name).first()
-            if tool:
-                if 'pricing' in enhancements:
-                    tool.pricing = enhancements['pricing']
-                if 'verified_integrations' in enhancements:
-                    tool.verified_integrations = json.dumps(enhancements['verified_integrations'])
-                if 'notable_strengths' in enhancements:
-                    tool.notable_strengths = json.dumps(enhancements['notable_strengths'])
-                if 'known_limitations' in enhancements:
-                    tool.known_limitations = json.dumps(enhancements['known_limitations'])
-                
-                print(f"Enhanced data for {tool_name}")
+        with db.engine.begin() as conn:
+            result = conn.execute(stmt, updates)
         
-        db.session.commit()
+        print(f"Enhanced data for {result.rowcount} tools")
         print("Enhanced data added successfully!")
 
 if __name__ == "__main__":
@@ -3,28 +3,75 @@ import sys
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+import orjson
 from flask import Flask, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from sqlalchemy.schema import CreateColumn
+from src.cache import cache
 from src.models.user import db
 from src.models.tool import DeveloperTool
+from src.models.search_index import ensure_search_index
 from src.routes.user import user_bp
 from src.routes.tools import tools_bp
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes responses with orjson"""
+
+    # Sorted keys match the output of Flask's default provider
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Same argument handling as jsonify(): one value, a list of values, or keyword items
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        if not args and not kwargs:
+            obj = None
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype='application/json')
+
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
+app.json = OrjsonProvider(app)
 
 # Enable CORS for all routes
 CORS(app)
+cache.init_app(app)
 
 app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(tools_bp, url_prefix='/api')
 
 # uncomment if you need to use database
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
+database_path = os.path.join(os.path.dirname(__file__), 'database', 'app.db')
+app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{database_path}"
+# Read-only connections for GET routes, so WAL readers never queue behind the writer
+app.config['SQLALCHEMY_BINDS'] = {'ro': f"sqlite:///file:{database_path}?mode=ro&uri=true"}
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db.init_app(app)
 with app.app_context():
     db.create_all()
+    # create_all() skips existing tables, so add the generated name_lc column
+    # and any indexes that databases created before them are missing
+    with db.engine.begin() as conn:
+        existing_columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_xinfo(developer_tools)")}
+        if 'name_lc' not in existing_columns:
+            column_ddl = CreateColumn(DeveloperTool.__table__.c.name_lc).compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE developer_tools ADD COLUMN {column_ddl}")
+    for index in DeveloperTool.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    with db.engine.begin() as conn:
+        ensure_search_index(conn)
+        # Refresh query planner statistics once per process start
+        conn.exec_driver_sql("PRAGMA optimize")
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
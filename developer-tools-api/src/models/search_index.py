@@ -0,0 +1,78 @@
+"""
+FTS5 full-text index over developer_tools.
+
+The index is an external-content FTS5 table kept in sync by triggers, so it
+stores only the inverted index and reads column values from developer_tools.
+"""
+
+import re
+
+from sqlalchemy import literal_column, select, table
+
+FTS_TABLE = 'dev_tools_fts'
+
+_CREATE_STATEMENTS = (
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        name, description, features,
+        content='developer_tools', content_rowid='id'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON developer_tools BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, description, features)
+        VALUES (new.id, new.name, new.description, new.features);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON developer_tools BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description, features)
+        VALUES ('delete', old.id, old.name, old.description, old.features);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON developer_tools BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description, features)
+        VALUES ('delete', old.id, old.name, old.description, old.features);
+        INSERT INTO {FTS_TABLE}(rowid, name, description, features)
+        VALUES (new.id, new.name, new.description, new.features);
+    END""",
+)
+
+
+def create_search_index(connection):
+    """(Re)create the FTS table and sync triggers, then index existing rows"""
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    for statement in _CREATE_STATEMENTS:
+        connection.exec_driver_sql(statement)
+    connection.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def ensure_search_index(connection):
+    """Create the FTS index for databases that predate it"""
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+    ).first()
+    if not exists:
+        create_search_index(connection)
+
+
+# Terms made only of token characters; only these are safe to match by prefix
+_PLAIN_TERM = re.compile(r'\w+')
+
+
+def _to_fts_term(term):
+    """Quote a term as an FTS5 phrase, matching by prefix only when the tokenizer keeps it whole"""
+    phrase = '"{}"'.format(term.replace('"', '""'))
+    if _PLAIN_TERM.fullmatch(term):
+        return phrase + '*'
+    # Punctuated terms like "C++" tokenize down to fragments such as "c", which
+    # would match nearly every row as a prefix, so match them as exact phrases
+    return phrase
+
+
+def to_fts_query(query_text):
+    """Quote each search term as an FTS5 query so user input is never parsed as syntax"""
+    return ' '.join(_to_fts_term(term) for term in query_text.split())
+
+
+def match_rowids(fts_query):
+    """Select the developer_tools ids whose name, description or features match an FTS5 query"""
+    return (
+        select(literal_column('rowid'))
+        .select_from(table(FTS_TABLE))
+        .where(literal_column(FTS_TABLE).match(fts_query))
+    )
@@ -1,27 +1,49 @@
+from sqlalchemy import event
+
+from src.models.search_index import create_search_index
+from src.models.types import JSONList
 from src.models.user import db
-import json
+
+# JSONList columns holding arrays
+JSON_ARRAY_FIELDS = (
+    'frameworks',
+    'supported_languages',
+    'features',
+    'native_integrations',
+    'verified_integrations',
+    'notable_strengths',
+    'known_limitations',
+)
+
+# Columns returned by the summary list view
+SUMMARY_FIELDS = ('id', 'name', 'category', 'description', 'url', 'maturity_score', 'popularity_score')
 
 class DeveloperTool(db.Model):
     __tablename__ = 'developer_tools'
+    __table_args__ = (
+        db.Index('ix_cat_pop', 'category', 'popularity_score'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False, unique=True)
-    category = db.Column(db.String(100), nullable=False)
+    # Lower-cased name for index-backed prefix search; VIRTUAL so it can be added to existing tables
+    name_lc = db.Column(db.String(200), db.Computed('lower(name)', persisted=False), index=True)
+    category = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.Text, nullable=True)
     url = db.Column(db.String(500), nullable=True)
     
     # JSON fields for arrays
-    frameworks = db.Column(db.Text, nullable=True)  # JSON array
-    supported_languages = db.Column(db.Text, nullable=True)  # JSON array
-    features = db.Column(db.Text, nullable=True)  # JSON array
-    native_integrations = db.Column(db.Text, nullable=True)  # JSON array
-    verified_integrations = db.Column(db.Text, nullable=True)  # JSON array
-    notable_strengths = db.Column(db.Text, nullable=True)  # JSON array
-    known_limitations = db.Column(db.Text, nullable=True)  # JSON array
+    frameworks = db.Column(JSONList, nullable=True)
+    supported_languages = db.Column(JSONList, nullable=True)
+    features = db.Column(JSONList, nullable=True)
+    native_integrations = db.Column(JSONList, nullable=True)
+    verified_integrations = db.Column(JSONList, nullable=True)
+    notable_strengths = db.Column(JSONList, nullable=True)
+    known_limitations = db.Column(JSONList, nullable=True)
     
     # Scoring fields
-    maturity_score = db.Column(db.Integer, nullable=True)  # 1-10
-    popularity_score = db.Column(db.Integer, nullable=True)  # 1-10
+    maturity_score = db.Column(db.Integer, nullable=True, index=True)  # 1-10
+    popularity_score = db.Column(db.Integer, nullable=True, index=True)  # 1-10
     
     # Additional fields for enhanced data
     pricing = db.Column(db.Text, nullable=True)
@@ -33,25 +55,6 @@ class DeveloperTool(db.Model):
     def __repr__(self):
         return f'<DeveloperTool {self.name}>'
 
-    def _parse_json_field(self, field_value):
-        """Helper method to parse JSON fields safely"""
-        if field_value is None or field_value == "Not specified":
-            return []
-        try:
-            if isinstance(field_value, str):
-                return json.loads(field_value)
-            return field_value if isinstance(field_value, list) else []
-        except (json.JSONDecodeError, TypeError):
-            return []
-
-    def _serialize_json_field(self, field_value):
-        """Helper method to serialize arrays to JSON"""
-        if field_value is None:
-            return None
-        if isinstance(field_value, list):
-            return json.dumps(field_value)
-        return field_value
-
     def to_dict(self):
         return {
             'id': self.id,
@@ -59,13 +62,13 @@ class DeveloperTool(db.Model):
             'category': self.category,
             'description': self.description,
             'url': self.url,
-            'frameworks': self._parse_json_field(self.frameworks),
-            'supported_languages': self._parse_json_field(self.supported_languages),
-            'features': self._parse_json_field(self.features),
-            'native_integrations': self._parse_json_field(self.native_integrations),
-            'verified_integrations': self._parse_json_field(self.verified_integrations),
-            'notable_strengths': self._parse_json_field(self.notable_strengths),
-            'known_limitations': self._parse_json_field(self.known_limitations),
+            'frameworks': self.frameworks,
+            'supported_languages': self.supported_languages,
+            'features': self.features,
+            'native_integrations': self.native_integrations,
+            'verified_integrations': self.verified_integrations,
+            'notable_strengths': self.notable_strengths,
+            'known_limitations': self.known_limitations,
             'maturity_score': self.maturity_score,
             'popularity_score': self.popularity_score,
             'pricing': self.pricing,
@@ -85,6 +88,19 @@ class DeveloperTool(db.Model):
             'popularity_score': self.popularity_score
         }
 
+    @classmethod
+    def row_to_dict(cls, row):
+        """Serialize a Core result mapping of developer_tools columns like to_dict()"""
+        data = {column.key: row[column.key] for column in cls.__table__.columns if column.computed is None}
+        for field in ('created_at', 'updated_at'):
+            data[field] = data[field].isoformat() if data[field] else None
+        return data
+
+    @staticmethod
+    def row_to_summary_dict(row):
+        """Serialize a Core result mapping like to_summary_dict()"""
+        return {field: row[field] for field in SUMMARY_FIELDS}
+
     @classmethod
     def from_dict(cls, data):
         """Create a DeveloperTool instance from a dictionary"""
@@ -93,15 +109,21 @@ class DeveloperTool(db.Model):
         tool.category = data.get('category')
         tool.description = data.get('description')
         tool.url = data.get('url')
-        tool.frameworks = tool._serialize_json_field(data.get('frameworks'))
-        tool.supported_languages = tool._serialize_json_field(data.get('supported_languages'))
-        tool.features = tool._serialize_json_field(data.get('features'))
-        tool.native_integrations = tool._serialize_json_field(data.get('native_integrations'))
-        tool.verified_integrations = tool._serialize_json_field(data.get('verified_integrations'))
-        tool.notable_strengths = tool._serialize_json_field(data.get('notable_strengths'))
-        tool.known_limitations = tool._serialize_json_field(data.get('known_limitations'))
+        tool.frameworks = data.get('frameworks')
+        tool.supported_languages = data.get('supported_languages')
+        tool.features = data.get('features')
+        tool.native_integrations = data.get('native_integrations')
+        tool.verified_integrations = data.get('verified_integrations')
+        tool.notable_strengths = data.get('notable_strengths')
+        tool.known_limitations = data.get('known_limitations')
         tool.maturity_score = data.get('maturity_score')
         tool.popularity_score = data.get('popularity_score')
         tool.pricing = data.get('pricing')
         return tool
 
+
+@event.listens_for(DeveloperTool.__table__, 'after_create')
+def _create_search_index(target, connection, **kw):
+    """Build the full-text index alongside a freshly created developer_tools table"""
+    create_search_index(connection)
+
@@ -0,0 +1,24 @@
+import orjson
+from sqlalchemy.types import Text, TypeDecorator
+
+
+class JSONList(TypeDecorator):
+    """Text column holding a JSON array, decoded to a Python list when loaded"""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        # Strings are stored as-is so LIKE patterns and pre-encoded JSON pass through
+        if value is None or isinstance(value, str):
+            return value
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value, dialect):
+        if value is None or value == "Not specified":
+            return []
+        try:
+            decoded = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return []
+        return decoded if isinstance(decoded, list) else []
@@ -1,7 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
 
+from src.models import sqlite  # noqa: F401 - registers the SQLite PRAGMA listener
+
 db = SQLAlchemy()
 
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
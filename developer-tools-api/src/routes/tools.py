@@ -1,9 +1,49 @@
-from flask import Blueprint, jsonify, request
-from src.models.tool import DeveloperTool, db
-from sqlalchemy import or_, and_
+import threading
+
+from flask import Blueprint, abort, jsonify, request
+from src.cache import cache
+from src.models.tool import JSON_ARRAY_FIELDS, SUMMARY_FIELDS, DeveloperTool, db
+from src.models.search_index import match_rowids, to_fts_query
+from sqlalchemy import or_, and_, func, lambda_stmt, select, update
 
 tools_bp = Blueprint('tools', __name__)
 
+# Cache keys for aggregate endpoints that only change when tools are written
+CATEGORIES_CACHE_KEY = 'tools/categories'
+STATS_CACHE_KEY = 'tools/stats'
+CACHE_TIMEOUT = 300
+
+# Read endpoints select plain columns and serialize the row mappings,
+# skipping ORM instance construction entirely
+_TOOL_COLUMNS = tuple(column for column in DeveloperTool.__table__.columns if column.computed is None)
+_SUMMARY_COLUMNS = tuple(DeveloperTool.__table__.c[field] for field in SUMMARY_FIELDS)
+
+# Columns a PUT may change; JSON array columns encode themselves via JSONList
+_UPDATABLE_FIELDS = (
+    'name', 'category', 'description', 'url', 'maturity_score', 'popularity_score', 'pricing'
+) + JSON_ARRAY_FIELDS
+
+# Characters with special meaning in a GLOB pattern
+_GLOB_WILDCARDS = frozenset('*?[]')
+
+# Serializes writes within this process; SQLite allows only one writer at a time
+_write_lock = threading.Lock()
+
+def _read_only():
+    """Session bind arguments that route a query to the read-only engine"""
+    return {'bind': db.engines['ro']}
+
+def _name_prefix_pattern(search):
+    """GLOB pattern matching names that start with search, or None if search contains GLOB wildcards"""
+    prefix = search.strip().lower()
+    if _GLOB_WILDCARDS.intersection(prefix):
+        return None
+    return f'{prefix}*'
+
+def _invalidate_tool_caches():
+    """Drop cached aggregates after a tool is created, updated or deleted"""
+    cache.delete_many(CATEGORIES_CACHE_KEY, STATS_CACHE_KEY)
+
 @tools_bp.route('/tools', methods=['GET'])
 def get_tools():
     """
@@ -22,58 +62,83 @@ def get_tools():
     per_page = min(int(request.args.get('per_page', 20)), 100)
     summary = request.args.get('summary', 'false').lower() == 'true'
     
-    # Build query
-    query = DeveloperTool.query
+    # Out-of-range values fall back to the defaults, as paginate(error_out=False) did
+    if page < 1:
+        page = 1
+    if per_page < 1:
+        per_page = 20
     
-    # Apply filters
+    # Filters are lambdas so SQLAlchemy caches the built statement and its
+    # compiled SQL; only the bound values change between requests
+    filters = []
     if category:
-        query = query.filter(DeveloperTool.category.ilike(f'%{category}%'))
+        category_pattern = f'%{category}%'
+        filters.append(lambda s: s.where(DeveloperTool.category.ilike(category_pattern)))
+    
+    if search and search.strip():
+        fts_query = to_fts_query(search)
+        name_prefix = _name_prefix_pattern(search)
+        if name_prefix:
+            # Also match names by prefix via the name_lc index, so partly typed
+            # punctuated names (e.g. "Locofy.a", "Claude/Cl") still match; FTS
+            # quotes such terms as exact phrases with no prefix
+            filters.append(lambda s: s.where(or_(
+                DeveloperTool.id.in_(match_rowids(fts_query)),
+                DeveloperTool.name_lc.op('GLOB')(name_prefix)
+            )))
+        else:
+            filters.append(lambda s: s.where(DeveloperTool.id.in_(match_rowids(fts_query))))
     
-    if search:
-        search_filter = or_(
-            DeveloperTool.name.ilike(f'%{search}%'),
-            DeveloperTool.description.ilike(f'%{search}%'),
-            DeveloperTool.features.ilike(f'%{search}%')
-        )
-        query = query.filter(search_filter)
+    # Summary view only needs the columns used by to_summary_dict()
+    if summary:
+        stmt = lambda_stmt(lambda: select(*_SUMMARY_COLUMNS))
+    else:
+        stmt = lambda_stmt(lambda: select(*_TOOL_COLUMNS))
+    for criterion in filters:
+        stmt += criterion
     
-    # Get paginated results
-    pagination = query.paginate(
-        page=page, 
-        per_page=per_page, 
-        error_out=False
-    )
+    # Fetch one row past the page to learn whether another page exists,
+    # rather than counting every matching row
+    offset = (page - 1) * per_page
+    limit = per_page + 1
+    stmt += lambda s: s.limit(limit).offset(offset)
     
-    tools = pagination.items
+    rows = db.session.execute(stmt, bind_arguments=_read_only()).mappings().all()
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
     
     # Choose serialization method
     if summary:
-        tools_data = [tool.to_summary_dict() for tool in tools]
+        tools_data = [DeveloperTool.row_to_summary_dict(row) for row in rows]
     else:
-        tools_data = [tool.to_dict() for tool in tools]
+        tools_data = [DeveloperTool.row_to_dict(row) for row in rows]
     
     return jsonify({
         'tools': tools_data,
         'pagination': {
             'page': page,
             'per_page': per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
+            'has_next': has_next,
+            'has_prev': page > 1
         }
     })
 
 @tools_bp.route('/tools/<int:tool_id>', methods=['GET'])
 def get_tool(tool_id):
     """Get a specific tool by ID"""
-    tool = DeveloperTool.query.get_or_404(tool_id)
+    tool = db.session.get(DeveloperTool, tool_id, bind_arguments=_read_only())
+    if tool is None:
+        abort(404)
     return jsonify(tool.to_dict())
 
 @tools_bp.route('/tools/categories', methods=['GET'])
+@cache.cached(timeout=CACHE_TIMEOUT, key_prefix=CATEGORIES_CACHE_KEY)
 def get_categories():
     """Get all unique categories"""
-    categories = db.session.query(DeveloperTool.category).distinct().all()
+    categories = db.session.execute(
+        select(DeveloperTool.category).distinct(),
+        bind_arguments=_read_only()
+    ).all()
     categories_list = [cat[0] for cat in categories if cat[0]]
     return jsonify({
         'categories': sorted(categories_list)
@@ -98,28 +163,25 @@ def search_tools():
     frameworks = request.args.get('frameworks', '').split(',') if request.args.get('frameworks') else []
     languages = request.args.get('languages', '').split(',') if request.args.get('languages') else []
     
-    # Build query
-    query = DeveloperTool.query
+    # Build query; each filter is a cached lambda, see get_tools()
+    stmt = lambda_stmt(lambda: select(*_TOOL_COLUMNS))
     
-    # Text search
-    if query_text:
-        search_filter = or_(
-            DeveloperTool.name.ilike(f'%{query_text}%'),
-            DeveloperTool.description.ilike(f'%{query_text}%'),
-            DeveloperTool.features.ilike(f'%{query_text}%')
-        )
-        query = query.filter(search_filter)
+    # Full-text search
+    if query_text.strip():
+        fts_query = to_fts_query(query_text)
+        stmt += lambda s: s.where(DeveloperTool.id.in_(match_rowids(fts_query)))
     
     # Category filter
     if category:
-        query = query.filter(DeveloperTool.category.ilike(f'%{category}%'))
+        category_pattern = f'%{category}%'
+        stmt += lambda s: s.where(DeveloperTool.category.ilike(category_pattern))
     
     # Score filters
     if min_maturity:
-        query = query.filter(DeveloperTool.maturity_score >= min_maturity)
+        stmt += lambda s: s.where(DeveloperTool.maturity_score >= min_maturity)
     
     if min_popularity:
-        query = query.filter(DeveloperTool.popularity_score >= min_popularity)
+        stmt += lambda s: s.where(DeveloperTool.popularity_score >= min_popularity)
     
     # Framework filters
     if frameworks:
@@ -128,7 +190,8 @@ def search_tools():
             if framework.strip():
                 framework_filters.append(DeveloperTool.frameworks.ilike(f'%{framework.strip()}%'))
         if framework_filters:
-            query = query.filter(or_(*framework_filters))
+            framework_filter = or_(*framework_filters)
+            stmt += lambda s: s.where(framework_filter)
     
     # Language filters
     if languages:
@@ -137,12 +200,13 @@ def search_tools():
             if language.strip():
                 language_filters.append(DeveloperTool.supported_languages.ilike(f'%{language.strip()}%'))
         if language_filters:
-            query = query.filter(or_(*language_filters))
+            language_filter = or_(*language_filters)
+            stmt += lambda s: s.where(language_filter)
     
-    tools = query.all()
+    rows = db.session.execute(stmt, bind_arguments=_read_only()).mappings().all()
     return jsonify({
-        'tools': [tool.to_dict() for tool in tools],
-        'count': len(tools)
+        'tools': [DeveloperTool.row_to_dict(row) for row in rows],
+        'count': len(rows)
     })
 
 @tools_bp.route('/tools', methods=['POST'])
@@ -154,79 +218,64 @@ def create_tool():
     if not data.get('name') or not data.get('category'):
         return jsonify({'error': 'Name and category are required'}), 400
     
-    # Check if tool already exists
-    existing_tool = DeveloperTool.query.filter_by(name=data['name']).first()
-    if existing_tool:
-        return jsonify({'error': 'Tool with this name already exists'}), 409
-    
-    tool = DeveloperTool.from_dict(data)
-    db.session.add(tool)
-    db.session.commit()
+    with _write_lock:
+        # Check if tool already exists
+        existing_tool = DeveloperTool.query.filter_by(name=data['name']).first()
+        if existing_tool:
+            return jsonify({'error': 'Tool with this name already exists'}), 409
+        
+        tool = DeveloperTool.from_dict(data)
+        db.session.add(tool)
+        db.session.commit()
+        _invalidate_tool_caches()
     
     return jsonify(tool.to_dict()), 201
 
 @tools_bp.route('/tools/<int:tool_id>', methods=['PUT'])
 def update_tool(tool_id):
     """Update a tool (for admin use)"""
-    tool = DeveloperTool.query.get_or_404(tool_id)
     data = request.json
     
-    # Update fields
-    if 'name' in data:
-        tool.name = data['name']
-    if 'category' in data:
-        tool.category = data['category']
-    if 'description' in data:
-        tool.description = data['description']
-    if 'url' in data:
-        tool.url = data['url']
-    if 'frameworks' in data:
-        tool.frameworks = tool._serialize_json_field(data['frameworks'])
-    if 'supported_languages' in data:
-        tool.supported_languages = tool._serialize_json_field(data['supported_languages'])
-    if 'features' in data:
-        tool.features = tool._serialize_json_field(data['features'])
-    if 'native_integrations' in data:
-        tool.native_integrations = tool._serialize_json_field(data['native_integrations'])
-    if 'verified_integrations' in data:
-        tool.verified_integrations = tool._serialize_json_field(data['verified_integrations'])
-    if 'notable_strengths' in data:
-        tool.notable_strengths = tool._serialize_json_field(data['notable_strengths'])
-    if 'known_limitations' in data:
-        tool.known_limitations = tool._serialize_json_field(data['known_limitations'])
-    if 'maturity_score' in data:
-        tool.maturity_score = data['maturity_score']
-    if 'popularity_score' in data:
-        tool.popularity_score = data['popularity_score']
-    if 'pricing' in data:
-        tool.pricing = data['pricing']
-    
-    db.session.commit()
+    # Only whitelisted fields are written
+    values = {field: data[field] for field in _UPDATABLE_FIELDS if field in data}
+    
+    if values:
+        with _write_lock:
+            result = db.session.execute(
+                update(DeveloperTool).where(DeveloperTool.id == tool_id).values(**values)
+            )
+            if result.rowcount == 0:
+                abort(404)
+            db.session.commit()
+            _invalidate_tool_caches()
+    
+    tool = DeveloperTool.query.get_or_404(tool_id)
     return jsonify(tool.to_dict())
 
 @tools_bp.route('/tools/<int:tool_id>', methods=['DELETE'])
 def delete_tool(tool_id):
     """Delete a tool (for admin use)"""
-    tool = DeveloperTool.query.get_or_404(tool_id)
-    db.session.delete(tool)
-    db.session.commit()
+    with _write_lock:
+        tool = DeveloperTool.query.get_or_404(tool_id)
+        db.session.delete(tool)
+        db.session.commit()
+        _invalidate_tool_caches()
     return '', 204
 
 @tools_bp.route('/tools/stats', methods=['GET'])
+@cache.cached(timeout=CACHE_TIMEOUT, key_prefix=STATS_CACHE_KEY)
 def get_stats():
     """Get API statistics"""
-    total_tools = DeveloperTool.query.count()
-    categories = db.session.query(DeveloperTool.category).distinct().count()
-    
-    # Category breakdown
-    category_stats = db.session.query(
-        DeveloperTool.category, 
-        db.func.count(DeveloperTool.id)
-    ).group_by(DeveloperTool.category).all()
+    # Totals are derived from the per-category counts, so one GROUP BY covers everything
+    category_stats = db.session.execute(
+        select(DeveloperTool.category, func.count(DeveloperTool.id)).group_by(DeveloperTool.category),
+        bind_arguments=_read_only()
+    ).all()
+    category_breakdown = dict(category_stats)
     
     return jsonify({
-        'total_tools': total_tools,
-        'total_categories': categories,
-        'category_breakdown': {cat: count for cat, count in category_stats}
+        'total_tools': sum(category_breakdown.values()),
+        'total_categories': len(category_breakdown),
+        'category_breakdown': category_breakdown
     })
 
@@ -41,7 +41,7 @@ def test_api_endpoints():
         if response.status_code == 200:
             data = response.get_json()
             print(f"Tools returned: {len(data.get('tools', []))}")
-            print(f"Total tools: {data.get('pagination', {}).get('total')}")
+            print(f"Has next page: {data.get('pagination', {}).get('has_next')}")
             print("Sample tools:")
             for tool in data.get('tools', [])[:3]:
                 print(f"  - {tool.get('name')} ({tool.get('category')})")
@@ -88,7 +88,19 @@ def test_api_endpoints():
             print(f"Integrations: {len(data.get('verified_integrations', []))} integrations")
         else:
             print(f"Error: {response.data}")
-        
+
+        # Test 6: Punctuated terms are not widened into single-letter prefix matches
+        print("\n6. Testing /api/tools/search?q=C%2B%2B")
+        response = client.get('/api/tools/search?q=C%2B%2B')
+        print(f"Status Code: {response.status_code}")
+        if response.status_code == 200:
+            cpp_count = response.get_json().get('count')
+            c_prefix_count = client.get('/api/tools/search?q=c').get_json().get('count')
+            print(f"C++ tools found: {cpp_count} (tools with a word starting with 'c': {c_prefix_count})")
+            assert cpp_count < c_prefix_count, "C++ search matched every tool with a word starting with 'c'"
+        else:
+            print(f"Error: {response.data}")
+
         print("\n" + "=" * 50)
         print("API testing completed!")
 